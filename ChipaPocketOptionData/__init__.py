@@ -5,19 +5,38 @@ A library for collecting high-volume PocketOption market data using multiple
 demo accounts with proxy support via multiprocessing.
 """
 
-from .multiprocessing_data import (
-    subscribe_symbol,
-    subscribe_symbol_timed,
-    subscribe_symbol_chunked,
-    get_candles,
-    DataCollectorConfig,
-)
+import importlib
+
+from .config import DataCollectorConfig, ProxyConfig
 
 __version__ = "1.0.0"
 __all__ = [
     "subscribe_symbol",
     "subscribe_symbol_timed", 
+    "subscribe_symbol_timed_multi",
     "subscribe_symbol_chunked",
     "get_candles",
     "DataCollectorConfig",
+    "ProxyConfig",
 ]
+
+# Collector functions load the multiprocessing stack on first access (PEP 562)
+_LAZY = {
+    "subscribe_symbol": ".multiprocessing_data",
+    "subscribe_symbol_timed": ".multiprocessing_data",
+    "subscribe_symbol_timed_multi": ".multiprocessing_data",
+    "subscribe_symbol_chunked": ".multiprocessing_data",
+    "get_candles": ".multiprocessing_data",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
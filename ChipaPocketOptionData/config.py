@@ -0,0 +1,129 @@
+"""
+Configuration objects for ChipaPocketOptionData.
+
+Kept free of multiprocessing and transport imports so configs can be built
+without loading the data collection machinery.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import sys
+
+
+_TRANSPORTS = ("auto", "queue", "faster_fifo", "zmq")
+# None keeps the platform's default multiprocessing start method
+_START_METHODS = (None, "fork", "spawn", "forkserver")
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _URLCache:
+    """Holds a cached URL in a slot outside the dataclass fields."""
+    __slots__ = ("_url",)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ProxyConfig(_URLCache):
+    """Configuration for a single proxy server (immutable once created)."""
+    host: str
+    port: int
+    username: Optional[str] = None
+    password: Optional[str] = None
+    protocol: str = "http"  # http, https, socks5
+    
+    def to_url(self) -> str:
+        """Convert proxy config to URL format."""
+        try:
+            return self._url
+        except AttributeError:
+            # First call on this instance (copies and unpickled proxies start empty)
+            auth = ""
+            if self.username and self.password:
+                auth = f"{self.username}:{self.password}@"
+            url = f"{self.protocol}://{auth}{self.host}:{self.port}"
+            object.__setattr__(self, '_url', url)
+            return url
+    
+    @classmethod
+    def from_records(cls, rows: Iterable[Sequence[Any]]) -> List["ProxyConfig"]:
+        """
+        Build proxies from ``(host, port[, username, password, protocol])`` rows.
+        
+        Meant for large proxy lists such as CSV rows: ports may be strings,
+        empty columns mean "not set", host names are interned and identical
+        rows share one instance.
+        """
+        cache: Dict[Tuple[Any, ...], ProxyConfig] = {}
+        proxies = []
+        for row in rows:
+            key = tuple(row)
+            proxy = cache.get(key)
+            if proxy is None:
+                host, port, username, password, protocol = (key + (None,) * 3)[:5]
+                proxy = cache[key] = cls(
+                    sys.intern(host),
+                    int(port),
+                    username or None,
+                    password or None,
+                    protocol or "http",
+                )
+            proxies.append(proxy)
+        return proxies
+
+
+@dataclass(frozen=True, **_SLOTS)
+class DataCollectorConfig:
+    """Configuration for the data collector (immutable once created)."""
+    ssids: List[str]
+    proxies: Optional[List[ProxyConfig]] = None
+    proxy_support: bool = False
+    max_workers: Optional[int] = None
+    reconnect_on_error: bool = True
+    error_retry_delay: int = 5
+    log_level: str = "INFO"
+    log_path: Optional[str] = None
+    transport: str = "auto"  # auto, queue, faster_fifo, zmq
+    connect_timeout: float = 5.0  # seconds to wait for each worker's connection
+    assets: Optional[List[str]] = None  # Assigned to SSIDs round-robin
+    start_method: Optional[str] = None  # None (platform default), fork, spawn, forkserver
+    # Derived from proxies in __post_init__
+    proxy_urls: Tuple[str, ...] = field(init=False, default=())
+    
+    def __post_init__(self):
+        """Validate configuration after initialization."""
+        if not self.ssids:
+            raise ValueError("At least one SSID must be provided")
+        
+        if self.assets and len(self.assets) > len(self.ssids):
+            raise ValueError(
+                f"Number of SSIDs ({len(self.ssids)}) must be >= "
+                f"number of assets ({len(self.assets)})"
+            )
+        
+        if self.transport not in _TRANSPORTS:
+            raise ValueError(
+                f"Unknown transport {self.transport!r}, expected one of {_TRANSPORTS}"
+            )
+        
+        if self.start_method not in _START_METHODS:
+            raise ValueError(
+                f"Unknown start_method {self.start_method!r}, "
+                f"expected one of {_START_METHODS}"
+            )
+        
+        if self.proxy_support and self.proxies:
+            if len(self.proxies) < len(self.ssids):
+                raise ValueError(
+                    f"Number of proxies ({len(self.proxies)}) must be >= "
+                    f"number of SSIDs ({len(self.ssids)})"
+                )
+        
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        if self.max_workers is None:
+            object.__setattr__(self, 'max_workers', len(self.ssids))
+        
+        if self.proxies:
+            object.__setattr__(
+                self, 'proxy_urls', tuple(proxy.to_url() for proxy in self.proxies)
+            )
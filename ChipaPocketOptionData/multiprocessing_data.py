@@ -7,56 +7,304 @@ multiple demo accounts, each with its own proxy server, via multiprocessing.
 
 import asyncio
 import multiprocessing as mp
-from typing import List, Dict, Any, Optional, AsyncIterator, Union
+from multiprocessing.connection import wait
+from typing import (
+    List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable, NamedTuple, Tuple,
+    Union,
+)
 from datetime import timedelta
-from dataclasses import dataclass, field
+import os
+import pickle
 import queue
+import random
 import signal
 import sys
+import tempfile
+import threading
+import time
 
+try:
+    import faster_fifo
+except ImportError:  # Optional: pip install ChipaPocketOptionData[fast]
+    faster_fifo = None
 
-@dataclass
-class ProxyConfig:
-    """Configuration for a single proxy server."""
-    host: str
-    port: int
-    username: Optional[str] = None
-    password: Optional[str] = None
-    protocol: str = "http"  # http, https, socks5
-    
-    def to_url(self) -> str:
-        """Convert proxy config to URL format."""
-        if self.username and self.password:
-            return f"{self.protocol}://{self.username}:{self.password}@{self.host}:{self.port}"
-        return f"{self.protocol}://{self.host}:{self.port}"
-
-
-@dataclass
-class DataCollectorConfig:
-    """Configuration for the data collector."""
-    ssids: List[str]
-    proxies: Optional[List[ProxyConfig]] = None
-    proxy_support: bool = False
-    max_workers: Optional[int] = None
-    reconnect_on_error: bool = True
-    error_retry_delay: int = 5
-    log_level: str = "INFO"
-    log_path: Optional[str] = None
-    
-    def __post_init__(self):
-        """Validate configuration after initialization."""
-        if not self.ssids:
-            raise ValueError("At least one SSID must be provided")
+try:
+    import zmq
+except ImportError:  # Optional: pip install ChipaPocketOptionData[zmq]
+    zmq = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: pip install ChipaPocketOptionData[uvloop]
+    uvloop = None
+
+try:
+    import msgspec
+except ImportError:  # Optional: pip install ChipaPocketOptionData[msgspec]
+    msgspec = None
+
+from .config import ProxyConfig, DataCollectorConfig
+
+
+# Workers batch candles before pushing them to the output queue; a batch is
+# flushed once it holds _BATCH_SIZE items or every _BATCH_WINDOW seconds.
+_BATCH_SIZE = 64
+_BATCH_WINDOW = 0.1
+# Consumers pull at most this many batches per queue access.
+_RECEIVE_MAX = 256
+# Batches buffered for an async consumer before the reader thread pauses.
+_ASYNC_BACKLOG = 64
+# Capacity of the output channel, per transport, in batches (_QUEUE_MAXSIZE is
+# shared across all worker queues).
+_QUEUE_MAXSIZE = 10000
+_QUEUE_MAX_BYTES = 10 * 1024 * 1024
+_ZMQ_HWM = 10000
+# First frame of every ZeroMQ message: raw serialized bytes or a pickle.
+_ZMQ_RAW = b"r"
+_ZMQ_PICKLE = b"p"
+
+# Connection readiness probe interval; the total wait is config.connect_timeout.
+_READY_PROBE_INTERVAL = 0.05
+# Extra time the parent allows for worker processes to start before connecting.
+_STARTUP_GRACE = 5
+# Upper bound for the exponential reconnect backoff, in seconds.
+_MAX_RETRY_DELAY = 60
+# The cached API is rebuilt after every this many consecutive failures, whatever the error.
+_API_RESET_FAILURES = 3
+
+# Sent on a worker's command queue to ask it to flush and exit
+_CMD_STOP = "stop"
+
+
+class _WorkerSettings(NamedTuple):
+    """The part of DataCollectorConfig a worker process needs."""
+    reconnect_on_error: bool
+    error_retry_delay: int
+    log_level: str
+    log_path: Optional[str]
+    connect_timeout: float
+    
+    @classmethod
+    def from_config(cls, config: DataCollectorConfig) -> "_WorkerSettings":
+        """Pick the worker settings out of a collector config."""
+        return cls(
+            config.reconnect_on_error,
+            config.error_retry_delay,
+            config.log_level,
+            config.log_path,
+            config.connect_timeout,
+        )
+
+
+class _ZmqChannel:
+    """
+    ZeroMQ PUSH/PULL channel exposing the faster-fifo queue interface.
+    
+    The parent binds a single PULL socket; every worker connects its own PUSH
+    socket on first use, so producers never contend on a shared lock. Batches
+    are pickled with protocol 5 and any out-of-band buffers are sent as extra
+    frames without copying.
+    """
+    
+    def __init__(self, hwm: int = _ZMQ_HWM):
+        self._hwm = hwm
+        self._owner_pid = os.getpid()
+        self._path: Optional[str] = None
+        self._push = None
+        self._linger = 1000
+        self._pull = zmq.Context.instance().socket(zmq.PULL)
+        self._pull.set_hwm(hwm)
+        if sys.platform == "win32":
+            port = self._pull.bind_to_random_port("tcp://127.0.0.1")
+            self.address = f"tcp://127.0.0.1:{port}"
+        else:
+            self._path = os.path.join(
+                tempfile.gettempdir(), f"chipa-{os.getpid()}-{id(self):x}.sock"
+            )
+            self.address = f"ipc://{self._path}"
+            self._pull.bind(self.address)
+        self._poller = zmq.Poller()
+        self._poller.register(self._pull, zmq.POLLIN)
+    
+    def __getstate__(self):
+        # Sockets cannot cross process boundaries; workers reconnect by address
+        return {'address': self.address, '_hwm': self._hwm, '_owner_pid': self._owner_pid}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._push = None
+        self._pull = None
+        self._linger = 1000
+    
+    def _connect(self):
+        """Return this process's PUSH socket, connecting it on first use."""
+        if self._push is None:
+            self._push = zmq.Context.instance().socket(zmq.PUSH)
+            self._push.set_hwm(self._hwm)
+            self._push.setsockopt(zmq.LINGER, self._linger)
+            self._push.connect(self.address)
+        return self._push
+    
+    def full(self) -> bool:
+        """Whether a send would block because the high-water mark is reached."""
+        return not self._connect().poll(0, zmq.POLLOUT)
+    
+    def put_nowait(self, message: Any):
+        """Send a message to the parent, raising ``queue.Full`` at the high-water mark."""
+        self._connect()
+        
+        if isinstance(message, bytes):
+            # Already serialized, send as-is
+            frames = [_ZMQ_RAW, message]
+        else:
+            buffers = []
+            header = pickle.dumps(message, protocol=5, buffer_callback=buffers.append)
+            frames = [_ZMQ_PICKLE, header, *buffers]
+        try:
+            self._push.send_multipart(frames, flags=zmq.NOBLOCK, copy=False)
+        except zmq.Again:
+            raise queue.Full
+    
+    def get_many(self, timeout: float, max_messages_to_get: int = _RECEIVE_MAX) -> List[Any]:
+        """Wait up to ``timeout`` seconds and return all immediately available messages."""
+        if self._pull is None or not self._poller.poll(timeout * 1000):
+            raise queue.Empty
         
-        if self.proxy_support and self.proxies:
-            if len(self.proxies) < len(self.ssids):
-                raise ValueError(
-                    f"Number of proxies ({len(self.proxies)}) must be >= "
-                    f"number of SSIDs ({len(self.ssids)})"
-                )
+        messages: List[Any] = []
+        while len(messages) < max_messages_to_get:
+            try:
+                kind, *frames = self._pull.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+            if kind.bytes == _ZMQ_RAW:
+                messages.append(frames[0].buffer)
+            else:
+                messages.append(pickle.loads(
+                    frames[0].buffer, buffers=[frame.buffer for frame in frames[1:]]
+                ))
+        return messages
+    
+    def cancel_join_thread(self):
+        """Don't wait for unsent batches when this process closes the channel."""
+        self._linger = 0
+    
+    def close(self):
+        """Close the sockets owned by the calling process."""
+        # The PULL socket goes first: context.term() below waits for every socket
+        if self._pull is not None and os.getpid() == self._owner_pid:
+            self._pull.close(linger=0)
+            self._pull = None
+            if self._path and os.path.exists(self._path):
+                os.unlink(self._path)
+        
+        if self._push is not None:
+            # Give queued batches a moment to reach the parent before exiting
+            context = self._push.context
+            self._push.close(linger=self._linger)
+            context.term()
+            self._push = None
+
+
+if msgspec is not None:
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+_Message = Tuple[int, List[Dict[str, Any]]]
+
+
+def _encode_batch(worker: int, batch: List[Dict[str, Any]]) -> Union[bytes, _Message]:
+    """
+    Serialize a worker's batch to MessagePack when msgspec is installed.
+    
+    Batches msgspec cannot encode, or every batch without msgspec, are returned
+    as a ``(worker, batch)`` tuple and left for the transport to pickle.
+    """
+    if msgspec is not None:
+        try:
+            return _msgpack_encoder.encode((worker, batch))
+        except TypeError:
+            pass
+    return worker, batch
+
+
+def _decode_batch(message: Any) -> _Message:
+    """Inverse of :func:`_encode_batch`."""
+    if isinstance(message, tuple):
+        return message
+    worker, batch = _msgpack_decoder.decode(message)
+    return worker, batch
+
+
+def _worker_context(start_method: Optional[str] = None):
+    """
+    Return the multiprocessing context used to start workers.
+    
+    ``None`` keeps the platform default. With ``forkserver`` the server
+    preloads BinaryOptionsToolsV2, so each worker is forked from a process
+    that already imported the extension instead of importing it again.
+    """
+    ctx = mp.get_context(start_method)
+    if start_method == "forkserver":
+        ctx.set_forkserver_preload(["BinaryOptionsToolsV2.pocketoption", __name__])
+    return ctx
+
+
+def _create_output_queue(transport: str, ctx, workers: int):
+    """Create the channel ``workers`` worker processes use to send data to the parent."""
+    if transport == "auto":
+        transport = "faster_fifo" if faster_fifo is not None else "queue"
+    
+    if transport == "faster_fifo":
+        if faster_fifo is None:
+            raise ImportError(
+                "transport='faster_fifo' requires faster-fifo "
+                "(pip install ChipaPocketOptionData[fast])"
+            )
+        return faster_fifo.Queue(max_size_bytes=_QUEUE_MAX_BYTES)
+    
+    if transport == "zmq":
+        if zmq is None:
+            raise ImportError(
+                "transport='zmq' requires pyzmq (pip install ChipaPocketOptionData[zmq])"
+            )
+        return _ZmqChannel()
+    
+    return _QueueGroup(ctx, workers)
+
+
+class _QueueGroup:
+    """
+    One ``multiprocessing.Queue`` per worker, read through a single wait.
+    
+    Workers never share a queue, so their feeder threads do not contend on a
+    common write lock, and the parent drains every ready queue per wakeup of
+    :func:`multiprocessing.connection.wait`.
+    """
+    
+    def __init__(self, ctx, workers: int):
+        # Queues hold batches; together they hold up to _QUEUE_MAXSIZE of them
+        maxsize = max(1, _QUEUE_MAXSIZE // workers)
+        self.queues: List[mp.Queue] = [ctx.Queue(maxsize=maxsize) for _ in range(workers)]
+        self._by_reader = {q._reader: q for q in self.queues}
+    
+    def get_many(self, timeout: float, max_messages_to_get: int = _RECEIVE_MAX) -> List[Any]:
+        """Wait up to ``timeout`` seconds and return messages from every ready queue."""
+        ready = wait(list(self._by_reader), timeout=timeout)
         
-        if self.max_workers is None:
-            self.max_workers = len(self.ssids)
+        # Split the budget so a busy worker cannot starve the others
+        share = max(1, max_messages_to_get // len(ready)) if ready else 0
+        messages: List[Any] = []
+        for reader in ready:
+            q = self._by_reader[reader]
+            for _ in range(share):
+                try:
+                    messages.append(q.get_nowait())
+                except queue.Empty:
+                    break
+        if not messages:
+            raise queue.Empty
+        return messages
 
 
 class _DataCollectorProcess:
@@ -64,131 +312,210 @@ class _DataCollectorProcess:
     
     def __init__(
         self,
+        index: int,
         ssid: str,
-        proxy: Optional[ProxyConfig],
+        proxy_url: Optional[str],
         output_queue: mp.Queue,
-        config: DataCollectorConfig,
+        commands: mp.Queue,
+        config: _WorkerSettings,
+        ready: Optional[mp.Event] = None,
+        dropped: Optional[Any] = None,
     ):
+        self.index = index
         self.ssid = ssid
-        self.proxy = proxy
+        self.proxy_url = proxy_url
         self.output_queue = output_queue
+        self.commands = commands
         self.config = config
-        self._stop_event = mp.Event()
+        # Set for the parent after the first connection attempt
+        self._ready = ready
+        # Set once a stop command arrives; the candle loop only reads this flag
+        self._stopping = False
+        self._batch: List[Dict[str, Any]] = []
+        # Items dropped on a full queue; shared with the parent, which reads it
+        # directly, so the count survives even if no batch gets through anymore
+        self._dropped = dropped if dropped is not None else mp.RawValue('q', 0)
+        self._retries = 0
+        self._api = None
     
-    async def _setup_api(self):
-        """Setup the PocketOption API with optional proxy."""
-        from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
+    def _emit(self, item: Dict[str, Any]):
+        """Buffer an item for the output queue, flushing full batches."""
+        self._batch.append(item)
+        if len(self._batch) >= _BATCH_SIZE:
+            self._flush()
+    
+    def _flush(self):
+        """Push all buffered items to the output queue."""
+        if not self._batch:
+            return
         
-        # TODO: When BinaryOptionsToolsV2 supports proxies, pass proxy config here
-        # For now, we'll need to set proxy at the environment/system level
-        if self.proxy:
-            # This would need to be implemented in BinaryOptionsToolsV2
-            # For now, we can set environment variables or use a proxy library
-            pass
+        batch, self._batch = self._batch, []
+        if self.output_queue.full():
+            # Consumer is behind: count the batch as dropped instead of raising
+            self._dropped.value += len(batch)
+            return
         
-        api = PocketOptionAsync(self.ssid)
-        await asyncio.sleep(5)  # Wait for connection
-        return api
+        try:
+            # One serialization and one queue write for the whole batch
+            self.output_queue.put_nowait(_encode_batch(self.index, batch))
+        except queue.Full:
+            # Filled up since the check above (or batch larger than the space left)
+            self._dropped.value += len(batch)
     
-    async def subscribe_symbol(self, asset: str):
-        """Subscribe to symbol updates."""
-        from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
+    def _stop_requested(self) -> bool:
+        """Whether the parent has sent a stop command."""
+        try:
+            return self.commands.get_nowait() == _CMD_STOP
+        except queue.Empty:
+            return False
+    
+    async def _housekeeping(self, main: "asyncio.Future[Any]"):
+        """Flush partial batches and poll for commands once per batch window."""
+        while True:
+            await asyncio.sleep(_BATCH_WINDOW)
+            self._flush()
+            if self._stop_requested():
+                self.stop()
+                # The parent stops reading after stop(); don't block exit on unsent batches
+                self.output_queue.cancel_join_thread()
+                # The stream may be parked waiting for its next candle
+                main.cancel()
+                return
+    
+    async def run(self, coro):
+        """Run a collection coroutine with background housekeeping."""
+        main = asyncio.ensure_future(coro)
+        housekeeping = asyncio.ensure_future(self._housekeeping(main))
+        try:
+            await main
+        except asyncio.CancelledError:
+            if not self._stopping:
+                raise
+        finally:
+            housekeeping.cancel()
+            self._flush()
+    
+    async def _setup_api(self):
+        """Setup the PocketOption API with optional proxy, reusing a live one."""
+        if self._api is not None:
+            return self._api
         
         try:
-            api = await self._setup_api()
-            stream = await api.subscribe_symbol(asset)
+            # Already imported by the forkserver preload; kept local so the package
+            # can be imported without the extension
+            from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
             
-            async for candle in stream:
-                if self._stop_event.is_set():
-                    break
-                
-                # Add metadata
-                candle['ssid'] = self.ssid
-                candle['proxy'] = self.proxy.to_url() if self.proxy else None
+            # TODO: When BinaryOptionsToolsV2 supports proxies, pass proxy config here
+            # For now, we'll need to set proxy at the environment/system level
+            if self.proxy_url:
+                # This would need to be implemented in BinaryOptionsToolsV2
+                # For now, we can set environment variables or use a proxy library
+                pass
+            
+            api = PocketOptionAsync(self.ssid)
+            await self._wait_until_ready(api)
+        finally:
+            # Connected or not, the first attempt is over
+            self._signal_ready()
+        self._api = api
+        return api
+    
+    def _signal_ready(self):
+        """Tell the parent this worker is done connecting; only the first call counts."""
+        if self._ready is not None:
+            self._ready.set()
+            self._ready = None
+    
+    async def _wait_until_ready(self, api):
+        """Poll the API until it reports a connection, up to connect_timeout."""
+        probe = getattr(api, 'is_connected', None)
+        deadline = time.monotonic() + self.config.connect_timeout
+        while time.monotonic() < deadline:
+            # A probe can hang while the websocket is still connecting
+            remaining = max(0, deadline - time.monotonic())
+            try:
+                if probe is not None:
+                    if await asyncio.wait_for(probe(), timeout=remaining):
+                        return
+                elif await asyncio.wait_for(api.balance(), timeout=remaining) >= 0:
+                    # The balance is only known once the session is established
+                    return
+            except Exception:
+                pass
+            await asyncio.sleep(_READY_PROBE_INTERVAL)
+    
+    @staticmethod
+    def _is_disconnect(error: Exception) -> bool:
+        """Whether an error means the API connection itself is gone."""
+        if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+            return True
+        message = str(error).lower()
+        return any(word in message for word in ('connect', 'closed', 'websocket'))
+    
+    def _backoff(self) -> float:
+        """Return the next reconnect delay (jittered exponential, capped)."""
+        delay = min(
+            _MAX_RETRY_DELAY,
+            self.config.error_retry_delay * 2 ** min(self._retries, 16),
+        )
+        self._retries += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    async def _stream(
+        self, kind: str, subscribe: Callable[[Any], Awaitable[AsyncIterator[Dict[str, Any]]]]
+    ):
+        """Pump a candle stream into the output queue, reconnecting on errors."""
+        while not self._stopping:
+            try:
+                api = await self._setup_api()
+                stream = await subscribe(api)
+                self._retries = 0
                 
-                try:
-                    self.output_queue.put_nowait(candle)
-                except queue.Full:
-                    # Queue is full, skip this candle
-                    pass
+                # The parent attaches ssid/proxy from its worker table
+                async for candle in stream:
+                    if self._stopping:
+                        break
                     
-        except Exception as e:
-            error_msg = {
-                'error': str(e),
-                'ssid': self.ssid,
-                'type': 'subscribe_symbol',
-            }
-            self.output_queue.put_nowait(error_msg)
-            
-            if self.config.reconnect_on_error:
-                await asyncio.sleep(self.config.error_retry_delay)
-                await self.subscribe_symbol(asset)
+                    self._emit(candle)
+                break
+                    
+            except Exception as e:
+                error_msg = {
+                    'error': str(e),
+                    'ssid': self.ssid,
+                    'type': kind,
+                }
+                self._emit(error_msg)
+                self._flush()
+                
+                # _retries counts the failures before this one
+                failures = self._retries + 1
+                if self._is_disconnect(e) or failures % _API_RESET_FAILURES == 0:
+                    self._api = None
+                if not self.config.reconnect_on_error:
+                    break
+                await asyncio.sleep(self._backoff())
+    
+    async def subscribe_symbol(self, asset: str):
+        """Subscribe to symbol updates."""
+        await self._stream(
+            'subscribe_symbol',
+            lambda api: api.subscribe_symbol(asset),
+        )
     
     async def subscribe_symbol_timed(self, asset: str, time_delta: timedelta):
         """Subscribe to symbol updates with time-based chunking."""
-        from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
-        
-        try:
-            api = await self._setup_api()
-            stream = await api.subscribe_symbol_timed(asset, time_delta)
-            
-            async for candle in stream:
-                if self._stop_event.is_set():
-                    break
-                
-                # Add metadata
-                candle['ssid'] = self.ssid
-                candle['proxy'] = self.proxy.to_url() if self.proxy else None
-                
-                try:
-                    self.output_queue.put_nowait(candle)
-                except queue.Full:
-                    pass
-                    
-        except Exception as e:
-            error_msg = {
-                'error': str(e),
-                'ssid': self.ssid,
-                'type': 'subscribe_symbol_timed',
-            }
-            self.output_queue.put_nowait(error_msg)
-            
-            if self.config.reconnect_on_error:
-                await asyncio.sleep(self.config.error_retry_delay)
-                await self.subscribe_symbol_timed(asset, time_delta)
+        await self._stream(
+            'subscribe_symbol_timed',
+            lambda api: api.subscribe_symbol_timed(asset, time_delta),
+        )
     
     async def subscribe_symbol_chunked(self, asset: str, chunk_size: int):
         """Subscribe to symbol updates with chunk-based aggregation."""
-        from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
-        
-        try:
-            api = await self._setup_api()
-            stream = await api.subscribe_symbol_chuncked(asset, chunk_size)
-            
-            async for candle in stream:
-                if self._stop_event.is_set():
-                    break
-                
-                # Add metadata
-                candle['ssid'] = self.ssid
-                candle['proxy'] = self.proxy.to_url() if self.proxy else None
-                
-                try:
-                    self.output_queue.put_nowait(candle)
-                except queue.Full:
-                    pass
-                    
-        except Exception as e:
-            error_msg = {
-                'error': str(e),
-                'ssid': self.ssid,
-                'type': 'subscribe_symbol_chunked',
-            }
-            self.output_queue.put_nowait(error_msg)
-            
-            if self.config.reconnect_on_error:
-                await asyncio.sleep(self.config.error_retry_delay)
-                await self.subscribe_symbol_chunked(asset, chunk_size)
+        await self._stream(
+            'subscribe_symbol_chunked',
+            lambda api: api.subscribe_symbol_chuncked(asset, chunk_size),
+        )
     
     async def get_candles(self, asset: str, period: int, time: int):
         """Get historical candles."""
@@ -197,16 +524,17 @@ class _DataCollectorProcess:
             candles = await api.get_candles(asset, period, time)
             
             # Add metadata to each candle
+            meta = {'ssid': self.ssid, 'proxy': self.proxy_url}
             for candle in candles:
-                candle['ssid'] = self.ssid
-                candle['proxy'] = self.proxy.to_url() if self.proxy else None
+                candle.update(meta)
             
             result = {
                 'type': 'candles',
                 'data': candles,
                 'ssid': self.ssid,
             }
-            self.output_queue.put_nowait(result)
+            self._emit(result)
+            self._flush()
             
         except Exception as e:
             error_msg = {
@@ -214,18 +542,23 @@ class _DataCollectorProcess:
                 'ssid': self.ssid,
                 'type': 'get_candles',
             }
-            self.output_queue.put_nowait(error_msg)
+            self._emit(error_msg)
+            self._flush()
     
     def stop(self):
         """Signal the process to stop."""
-        self._stop_event.set()
+        self._stopping = True
 
 
 def _worker_process(
+    index: int,
     ssid: str,
-    proxy: Optional[ProxyConfig],
+    proxy_url: Optional[str],
     output_queue: mp.Queue,
-    config: DataCollectorConfig,
+    commands: mp.Queue,
+    config: _WorkerSettings,
+    ready: mp.Event,
+    dropped: Any,
     method: str,
     *args,
     **kwargs,
@@ -243,20 +576,26 @@ def _worker_process(
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Create collector and run the appropriate method
-    collector = _DataCollectorProcess(ssid, proxy, output_queue, config)
+    # Create collector and run the appropriate method, on uvloop if available
+    collector = _DataCollectorProcess(
+        index, ssid, proxy_url, output_queue, commands, config, ready, dropped
+    )
+    run = uvloop.run if uvloop is not None else asyncio.run
     
     try:
         if method == 'subscribe_symbol':
-            asyncio.run(collector.subscribe_symbol(*args, **kwargs))
+            run(collector.run(collector.subscribe_symbol(*args, **kwargs)))
         elif method == 'subscribe_symbol_timed':
-            asyncio.run(collector.subscribe_symbol_timed(*args, **kwargs))
+            run(collector.run(collector.subscribe_symbol_timed(*args, **kwargs)))
         elif method == 'subscribe_symbol_chunked':
-            asyncio.run(collector.subscribe_symbol_chunked(*args, **kwargs))
+            run(collector.run(collector.subscribe_symbol_chunked(*args, **kwargs)))
         elif method == 'get_candles':
-            asyncio.run(collector.get_candles(*args, **kwargs))
+            run(collector.run(collector.get_candles(*args, **kwargs)))
     except KeyboardInterrupt:
         pass
+    finally:
+        if isinstance(output_queue, _ZmqChannel):
+            output_queue.close()
 
 
 class MultiProcessDataCollector:
@@ -264,72 +603,250 @@ class MultiProcessDataCollector:
     
     def __init__(self, config: DataCollectorConfig):
         self.config = config
-        self.output_queue = mp.Queue(maxsize=10000)
+        self._ctx = _worker_context(config.start_method)
+        self.output_queue = _create_output_queue(
+            config.transport, self._ctx, len(config.ssids)
+        )
         self.processes: List[mp.Process] = []
+        # One command queue per worker, used to ask it to stop
+        self._commands: List[mp.Queue] = []
+        # {'ssid', 'proxy', 'asset'} per worker index, merged into items on receipt
+        self._workers: List[Dict[str, Optional[str]]] = []
         self._started = False
+        # Per-worker counts of items dropped because the output queue was full
+        self._drop_counts: List[Any] = []
+        # Items produced by the parent itself, delivered before worker data
+        self._pending: List[Dict[str, Any]] = []
+        # Reader thread of the running async iteration, and its stop flag
+        self._reader: Optional[threading.Thread] = None
+        self._reader_done: Optional[threading.Event] = None
     
-    def _start_processes(self, method: str, *args, **kwargs):
-        """Start worker processes."""
-        if self._started:
-            raise RuntimeError("Collector already started")
+    @property
+    def dropped(self) -> int:
+        """Items workers dropped because the output queue was full."""
+        return sum(count.value for count in self._drop_counts)
+    
+    def _assign_workers(self) -> List[Dict[str, Any]]:
+        """Return the SSID, proxy and asset of each worker, in start order."""
+        if not self.config.assets:
+            raise ValueError("At least one asset must be provided")
         
+        assets = self.config.assets
+        proxy_urls = self.config.proxy_urls if self.config.proxy_support else ()
+        workers = []
         for i, ssid in enumerate(self.config.ssids):
-            proxy = None
-            if self.config.proxy_support and self.config.proxies:
+            proxy_url = None
+            if proxy_urls:
                 # Assign proxy to this SSID (round-robin if more SSIDs than proxies)
-                proxy = self.config.proxies[i % len(self.config.proxies)]
+                proxy_url = proxy_urls[i % len(proxy_urls)]
             
-            process = mp.Process(
+            # Spread assets over SSIDs the same way
+            asset = assets[i % len(assets)]
+            workers.append({'ssid': ssid, 'proxy': proxy_url, 'asset': asset})
+        return workers
+    
+    def _start_processes(self, method: str, *args, **kwargs):
+        """Start one worker per SSID, each collecting one of the configured assets."""
+        if self._started:
+            raise RuntimeError("Collector already started")
+        
+        self._workers = self._assign_workers()
+        settings = _WorkerSettings.from_config(self.config)
+        # Each worker sets its event once its first connection attempt is over
+        ready: List[mp.Event] = []
+        self._drop_counts = []
+        self._commands = []
+        for i, worker in enumerate(self._workers):
+            ssid, proxy_url, asset = worker['ssid'], worker['proxy'], worker['asset']
+            ready.append(self._ctx.Event())
+            # Only the worker writes its counter, so it needs no lock
+            self._drop_counts.append(self._ctx.RawValue('q', 0))
+            commands = self._ctx.Queue()
+            self._commands.append(commands)
+            output = self.output_queue
+            if isinstance(output, _QueueGroup):
+                output = output.queues[i]
+            process = self._ctx.Process(
                 target=_worker_process,
-                args=(ssid, proxy, self.output_queue, self.config, method, *args),
+                args=(
+                    i, ssid, proxy_url, output, commands,
+                    settings, ready[i], self._drop_counts[i], method, asset, *args,
+                ),
                 kwargs=kwargs,
             )
             process.start()
             self.processes.append(process)
         
         self._started = True
+        self._await_workers(method, ready)
     
-    def __iter__(self):
-        """Iterate over collected data (blocking)."""
+    def _await_workers(self, method: str, ready: List[Any]):
+        """
+        Wait until every worker has tried to connect once, or has died.
+        
+        Workers that exit before that (for example a script without an
+        ``if __name__ == "__main__":`` guard under spawn/forkserver) are reported
+        as error items instead of silently producing nothing.
+        """
+        deadline = time.monotonic() + self.config.connect_timeout + _STARTUP_GRACE
+        pending = set(range(len(self.processes)))
+        while pending:
+            for i in list(pending):
+                process = self.processes[i]
+                if ready[i].is_set():
+                    pending.discard(i)
+                elif not process.is_alive():
+                    pending.discard(i)
+                    self._pending.append({
+                        'error': (
+                            f"Worker process exited with code {process.exitcode} "
+                            "before connecting"
+                        ),
+                        'type': method,
+                        **self._workers[i],
+                    })
+            
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                # Slow workers still deliver their data (or error) later
+                break
+            # Wakes up as soon as a pending worker exits
+            wait(
+                [self.processes[i].sentinel for i in pending],
+                timeout=min(_READY_PROBE_INTERVAL, remaining),
+            )
+    
+    def _receive(self, timeout: float) -> List[Any]:
+        """Wait up to ``timeout`` seconds and return the next received items."""
+        if self._pending:
+            items, self._pending = self._pending, []
+            return items
+        
+        messages = self.output_queue.get_many(
+            timeout=timeout, max_messages_to_get=_RECEIVE_MAX
+        )
+        
+        items: List[Any] = []
+        for message in messages:
+            worker, batch = _decode_batch(message)
+            template = self._workers[worker]
+            for item in batch:
+                item.update(template)
+            items.extend(batch)
+        return items
+    
+    def iter_batches(self):
+        """Iterate over collected data one received batch (a list of items) at a time."""
         while True:
             try:
-                data = self.output_queue.get(timeout=1)
-                yield data
+                batch = self._receive(timeout=1)
             except queue.Empty:
                 # Check if any processes are still alive
                 if not any(p.is_alive() for p in self.processes):
+                    # All workers are done; release the channel and command queues
+                    self.stop()
                     break
+                continue
             except KeyboardInterrupt:
                 self.stop()
                 break
+            yield batch
+    
+    def __iter__(self):
+        """Iterate over collected data (blocking)."""
+        for batch in self.iter_batches():
+            yield from batch
+    
+    def _drain(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batches: "asyncio.Queue[Optional[List[Any]]]",
+        done: threading.Event,
+    ):
+        """Reader thread: forward output queue batches to an asyncio queue."""
+        try:
+            while not done.is_set():
+                if batches.qsize() >= _ASYNC_BACKLOG:
+                    # Consumer is behind; leave data in the output queue
+                    time.sleep(_BATCH_WINDOW)
+                    continue
+                try:
+                    batch = self._receive(timeout=1)
+                except queue.Empty:
+                    if done.is_set():
+                        # stop() was called, the channel may already be closed
+                        break
+                    if not any(p.is_alive() for p in self.processes):
+                        self.stop()
+                        break
+                    continue
+                loop.call_soon_threadsafe(batches.put_nowait, batch)
+            loop.call_soon_threadsafe(batches.put_nowait, None)
+        except RuntimeError:
+            # Event loop closed before the consumer finished
+            pass
     
     async def __aiter__(self):
         """Async iterate over collected data."""
-        while True:
-            try:
-                # Use asyncio-compatible queue access
-                data = await asyncio.get_event_loop().run_in_executor(
-                    None, self.output_queue.get, True, 1
-                )
-                yield data
-            except queue.Empty:
-                if not any(p.is_alive() for p in self.processes):
+        batches: "asyncio.Queue[Optional[List[Any]]]" = asyncio.Queue()
+        done = threading.Event()
+        reader = threading.Thread(
+            target=self._drain,
+            args=(asyncio.get_running_loop(), batches, done),
+            daemon=True,
+        )
+        self._reader, self._reader_done = reader, done
+        reader.start()
+        try:
+            while True:
+                batch = await batches.get()
+                if batch is None:
                     break
-            except KeyboardInterrupt:
-                self.stop()
-                break
+                for data in batch:
+                    yield data
+        except KeyboardInterrupt:
+            self.stop()
+        finally:
+            done.set()
     
     def stop(self):
         """Stop all worker processes."""
+        if self._reader_done is not None:
+            self._reader_done.set()
+        
+        # Ask every worker to flush and exit, then give them a moment together
+        for process, commands in zip(self.processes, self._commands):
+            if process.is_alive():
+                commands.put(_CMD_STOP)
+        
+        deadline = time.monotonic() + 1
+        for process in self.processes:
+            process.join(timeout=max(0, deadline - time.monotonic()))
+        
+        # Fall back to signals for workers stuck outside their event loop
         for process in self.processes:
             if process.is_alive():
                 process.terminate()
-                process.join(timeout=5)
+                process.join(timeout=1)
                 if process.is_alive():
                     process.kill()
         
+        for commands in self._commands:
+            # An unread stop command must not keep this process from exiting
+            commands.cancel_join_thread()
+            commands.close()
+        
+        self._commands.clear()
         self.processes.clear()
         self._started = False
+        
+        # The reader thread must be out of the output queue before it closes
+        reader, self._reader, self._reader_done = self._reader, None, None
+        if reader is not None and reader is not threading.current_thread():
+            reader.join()
+        
+        if isinstance(self.output_queue, _ZmqChannel):
+            self.output_queue.close()
     
     def __enter__(self):
         """Context manager entry."""
@@ -383,13 +900,14 @@ def subscribe_symbol(
     """
     config = DataCollectorConfig(
         ssids=ssids,
+        assets=[asset],
         proxies=proxies,
         proxy_support=proxy_support,
         **config_kwargs,
     )
     
     collector = MultiProcessDataCollector(config)
-    collector._start_processes('subscribe_symbol', asset)
+    collector._start_processes('subscribe_symbol')
     return collector
 
 
@@ -436,13 +954,68 @@ def subscribe_symbol_timed(
     
     config = DataCollectorConfig(
         ssids=ssids,
+        assets=[asset],
         proxies=proxies,
         proxy_support=proxy_support,
         **config_kwargs,
     )
     
     collector = MultiProcessDataCollector(config)
-    collector._start_processes('subscribe_symbol_timed', asset, time_delta)
+    collector._start_processes('subscribe_symbol_timed', time_delta)
+    return collector
+
+
+def subscribe_symbol_timed_multi(
+    assets: List[str],
+    time_delta: Union[timedelta, int],
+    ssids: List[str],
+    proxies: Optional[List[ProxyConfig]] = None,
+    proxy_support: bool = False,
+    **config_kwargs,
+) -> MultiProcessDataCollector:
+    """
+    Subscribe to time-chunked updates for several assets with one collector.
+    
+    Assets are assigned to SSIDs round-robin, so each worker process collects
+    a single asset and all of them share one output queue. Every item carries
+    an ``'asset'`` key to tell the streams apart.
+    
+    Args:
+        assets: Asset symbols to subscribe to (e.g., ["EURUSD_otc", "GBPUSD_otc"])
+        time_delta: Time delta for chunking (timedelta or seconds as int)
+        ssids: List of session IDs for demo accounts (at least one per asset)
+        proxies: Optional list of proxy configurations
+        proxy_support: Enable proxy support
+        **config_kwargs: Additional configuration options
+    
+    Returns:
+        MultiProcessDataCollector instance that can be iterated over
+    
+    Example:
+        >>> from ChipaPocketOptionData import subscribe_symbol_timed_multi
+        >>> 
+        >>> collector = subscribe_symbol_timed_multi(
+        ...     ["EURUSD_otc", "GBPUSD_otc"],
+        ...     time_delta=5,
+        ...     ssids=["ssid1", "ssid2", "ssid3", "ssid4"],
+        ... )
+        >>> 
+        >>> for candle in collector:
+        ...     print(f"{candle['asset']}: {candle['close']}")
+    """
+    if isinstance(time_delta, int):
+        time_delta = timedelta(seconds=time_delta)
+    
+    config = DataCollectorConfig(
+        ssids=ssids,
+        assets=assets,
+        proxies=proxies,
+        proxy_support=proxy_support,
+        **config_kwargs,
+    )
+    
+    collector = MultiProcessDataCollector(config)
+    collector._start_processes('subscribe_symbol_timed', time_delta)
     return collector
 
 
@@ -484,13 +1057,14 @@ def subscribe_symbol_chunked(
     """
     config = DataCollectorConfig(
         ssids=ssids,
+        assets=[asset],
         proxies=proxies,
         proxy_support=proxy_support,
         **config_kwargs,
     )
     
     collector = MultiProcessDataCollector(config)
-    collector._start_processes('subscribe_symbol_chunked', asset, chunk_size)
+    collector._start_processes('subscribe_symbol_chunked', chunk_size)
     return collector
 
 
@@ -532,20 +1106,25 @@ def get_candles(
     """
     config = DataCollectorConfig(
         ssids=ssids,
+        assets=[asset],
         proxies=proxies,
         proxy_support=proxy_support,
         **config_kwargs,
     )
     
     collector = MultiProcessDataCollector(config)
-    collector._start_processes('get_candles', asset, period, time)
+    collector._start_processes('get_candles', period, time)
     
     # Collect all results
     all_candles = []
-    for data in collector:
-        if 'error' in data:
-            print(f"Error from {data['ssid']}: {data['error']}")
-        elif data.get('type') == 'candles':
-            all_candles.extend(data['data'])
+    try:
+        for data in collector:
+            err = data.get('error')
+            if err is not None:
+                print(f"Error from {data['ssid']}: {err}")
+            elif data.get('type') == 'candles':
+                all_candles.extend(data['data'])
+    finally:
+        collector.stop()
     
     return all_candles
@@ -34,8 +34,9 @@ def main():
     try:
         # Iterate over incoming candles
         for i, candle in enumerate(collector):
-            if 'error' in candle:
-                print(f"Error from {candle['ssid']}: {candle['error']}")
+            err = candle.get('error')
+            if err is not None:
+                print(f"Error from {candle['ssid']}: {err}")
                 continue
             
             print(f"Candle #{i+1} from {candle['ssid']}: "
@@ -13,6 +13,9 @@ from ChipaPocketOptionData import subscribe_symbol_timed
 def setup_database(db_path: str = "pocketoption_data.db"):
     """Create the database schema."""
     conn = sqlite3.connect(db_path)
+    # WAL with synchronous=NORMAL avoids an fsync on every commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -46,29 +49,47 @@ def setup_database(db_path: str = "pocketoption_data.db"):
     return conn
 
 
-def save_candle(conn: sqlite3.Connection, asset: str, candle: dict):
-    """Save a candle to the database."""
-    cursor = conn.cursor()
+class CandleWriter:
+    """Buffer candles and write them to the database in batches."""
     
-    cursor.execute("""
+    INSERT_SQL = """
         INSERT INTO candles (
             ssid, proxy, asset, open, close, high, low, 
             volume, time_frame, raw_data
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        candle.get('ssid'),
-        candle.get('proxy'),
-        asset,
-        candle.get('open'),
-        candle.get('close'),
-        candle.get('high'),
-        candle.get('low'),
-        candle.get('volume'),
-        candle.get('time_frame'),
-        str(candle)  # Store raw data as JSON string
-    ))
+    """
     
-    conn.commit()
+    def __init__(self, conn: sqlite3.Connection, batch_size: int = 500):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.rows = []
+    
+    def append(self, asset: str, candle: dict):
+        """Queue a candle, writing the batch once it is full."""
+        self.rows.append((
+            candle.get('ssid'),
+            candle.get('proxy'),
+            asset,
+            candle.get('open'),
+            candle.get('close'),
+            candle.get('high'),
+            candle.get('low'),
+            candle.get('volume'),
+            candle.get('time_frame'),
+            str(candle)  # Store raw data as JSON string
+        ))
+        
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered candles in a single transaction."""
+        if not self.rows:
+            return
+        
+        with self.conn:
+            self.conn.executemany(self.INSERT_SQL, self.rows)
+        self.rows.clear()
 
 
 def main():
@@ -76,6 +97,7 @@ def main():
     # Setup database
     print("Setting up database...")
     db_conn = setup_database()
+    writer = CandleWriter(db_conn)
     
     # Configure data collection
     ssids = [
@@ -103,13 +125,14 @@ def main():
     
     try:
         for candle in collector:
-            if 'error' in candle:
+            err = candle.get('error')
+            if err is not None:
                 error_count += 1
-                print(f"⚠️  Error: {candle['error']}")
+                print(f"⚠️  Error: {err}")
                 continue
             
-            # Save to database
-            save_candle(db_conn, asset, candle)
+            # Save to database (written in batches)
+            writer.append(asset, candle)
             candle_count += 1
             
             if candle_count % 10 == 0:
@@ -120,6 +143,7 @@ def main():
         print("\n\nStopping data collection...")
     finally:
         collector.stop()
+        writer.flush()
         db_conn.close()
         print(f"\nData collection stopped.")
         print(f"Total candles saved: {candle_count}")
@@ -5,7 +5,13 @@ This example shows how to configure and use proxy servers with the data collecto
 """
 
 from ChipaPocketOptionData import subscribe_symbol_timed, ProxyConfig
+from collections import Counter
 from datetime import timedelta
+import sys
+
+# Candle lines are written to stdout once per received batch, or every this many
+FLUSH_EVERY = 64
+STATS_HEADER = "\n--- Statistics (Total: {} candles) ---\n"
 
 
 def main():
@@ -57,41 +63,66 @@ def main():
         error_retry_delay=5,
     )
     
+    # Pending output lines, written with one call per batch
+    buf = []
+    
+    def flush():
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+            buf.clear()
+    
     try:
         # Iterate over incoming candles
-        candle_count = {}
+        candle_count = Counter()
+        total = 0
+        # " via <url>" per proxy URL; there is one URL per worker at most
+        proxy_suffix = {}
         
-        for candle in collector:
-            if 'error' in candle:
-                print(f"⚠️  Error from {candle['ssid']}: {candle['error']}")
-                continue
-            
-            # Track candles per SSID
-            ssid = candle['ssid']
-            candle_count[ssid] = candle_count.get(ssid, 0) + 1
-            
-            proxy_info = f" via {candle['proxy']}" if candle['proxy'] else ""
-            print(f"✓ Candle from {ssid}{proxy_info}: "
-                  f"Close={candle.get('close'):.5f}")
+        # Candles that arrived together are printed together
+        for batch in collector.iter_batches():
+            for candle in batch:
+                err = candle.get('error')
+                if err is not None:
+                    buf.append(f"⚠️  Error from {candle['ssid']}: {err}\n")
+                    continue
+                
+                # Track candles per SSID
+                ssid = candle['ssid']
+                candle_count[ssid] += 1
+                total += 1
+                
+                proxy = candle['proxy']
+                proxy_info = proxy_suffix.get(proxy)
+                if proxy_info is None:
+                    proxy_info = proxy_suffix[proxy] = f" via {proxy}" if proxy else ""
+                buf.append(f"✓ Candle from {ssid}{proxy_info}: "
+                           f"Close={candle.get('close'):.5f}\n")
+                
+                # Print statistics every 50 candles
+                if total % 50 == 0:
+                    buf.append(STATS_HEADER.format(total) + "".join(
+                        f"  {sid}: {count} candles\n" for sid, count in candle_count.items()
+                    ) + "\n")
+                
+                if len(buf) >= FLUSH_EVERY:
+                    flush()
             
-            # Print statistics every 50 candles
-            total = sum(candle_count.values())
-            if total % 50 == 0:
-                print(f"\n--- Statistics (Total: {total} candles) ---")
-                for sid, count in candle_count.items():
-                    print(f"  {sid}: {count} candles")
-                print()
+            # Nothing else is ready yet; show this batch now
+            flush()
     
     except KeyboardInterrupt:
+        flush()
         print("\n\nStopping data collection...")
     finally:
+        flush()
         collector.stop()
         print("Data collection stopped.")
         
         if candle_count:
-            print("\n--- Final Statistics ---")
-            for ssid, count in candle_count.items():
-                print(f"  {ssid}: {count} candles collected")
+            sys.stdout.write("\n--- Final Statistics ---\n" + "\n".join(
+                f"  {ssid}: {count} candles collected" for ssid, count in candle_count.items()
+            ) + "\n")
 
 
 if __name__ == "__main__":
@@ -194,8 +194,9 @@ collector = subscribe_symbol_timed(
 try:
     candle_count = 0
     for candle in collector:
-        if 'error' in candle:
-            print(f"⚠️  Error from {candle['ssid']}: {candle['error']}")
+        err = candle.get('error')
+        if err is not None:
+            print(f"⚠️  Error from {candle['ssid']}: {err}")
             continue
         
         # Display candle data
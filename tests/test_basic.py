@@ -2,8 +2,12 @@
 Test script to verify ChipaPocketOptionData installation and basic functionality.
 """
 
-import asyncio
+import dataclasses
+import importlib
+import multiprocessing
+import queue
 import sys
+import time
 from datetime import timedelta
 
 
@@ -11,14 +15,19 @@ def test_imports():
     """Test that all imports work correctly."""
     print("Testing imports...")
     try:
-        from ChipaPocketOptionData import (
-            subscribe_symbol,
-            subscribe_symbol_timed,
-            subscribe_symbol_chunked,
-            get_candles,
-            DataCollectorConfig,
-            ProxyConfig,
-        )
+        package = importlib.import_module("ChipaPocketOptionData")
+        for name in (
+            "subscribe_symbol",
+            "subscribe_symbol_timed",
+            "subscribe_symbol_timed_multi",
+            "subscribe_symbol_chunked",
+            "get_candles",
+            "DataCollectorConfig",
+            "ProxyConfig",
+        ):
+            # Resolving the collector functions loads them lazily
+            if not hasattr(package, name):
+                raise ImportError(f"cannot import name {name!r}")
         print("✅ All imports successful")
         return True
     except ImportError as e:
@@ -53,6 +62,24 @@ def test_proxy_config():
         )
         assert proxy3.to_url() == "socks5://socks.example.com:1080"
         
+        # Test bulk creation; identical rows share one instance
+        proxies = ProxyConfig.from_records([
+            ("proxy.example.com", "8080"),
+            ("socks.example.com", 1080, None, None, "socks5"),
+            ("proxy.example.com", "8080"),
+        ])
+        assert proxies[0] == proxy1 and proxies[1] == proxy3
+        assert proxies[2] is proxies[0]
+        
+        # Empty CSV columns fall back to the defaults
+        csv_proxy, = ProxyConfig.from_records([["proxy.example.com", "8080", "", "", ""]])
+        assert csv_proxy == proxy1
+        assert csv_proxy.to_url() == "http://proxy.example.com:8080"
+        
+        # The cached URL is not a field, so configs round-trip through asdict
+        copied = ProxyConfig(**dataclasses.asdict(proxy2))
+        assert copied == proxy2 and copied.to_url() == proxy2.to_url()
+        
         print("✅ ProxyConfig works correctly")
         return True
     except Exception as e:
@@ -94,6 +121,60 @@ def test_data_collector_config():
         except ValueError:
             pass  # Expected
         
+        # Test validation (should fail with an unknown transport)
+        try:
+            DataCollectorConfig(ssids=["ssid1"], transport="bogus")
+            print("❌ Should have raised ValueError for unknown transport")
+            return False
+        except ValueError:
+            pass  # Expected
+        
+        # Test validation (should fail with an unknown start method)
+        try:
+            DataCollectorConfig(ssids=["ssid1"], start_method="bogus")
+            print("❌ Should have raised ValueError for unknown start_method")
+            return False
+        except ValueError:
+            pass  # Expected
+        
+        # Configs are immutable once created
+        for obj, attr in ((config1, "ssids"), (proxies[0], "host")):
+            try:
+                setattr(obj, attr, None)
+                print(f"❌ Should not be able to assign {type(obj).__name__}.{attr}")
+                return False
+            except dataclasses.FrozenInstanceError:
+                pass  # Expected
+        
+        # Positional arguments keep their pre-assets meaning
+        config4 = DataCollectorConfig(["ssid1", "ssid2"], proxies, True)
+        assert config4.proxies == proxies and config4.assets is None
+        
+        # Test validation (should fail with more assets than SSIDs)
+        try:
+            DataCollectorConfig(ssids=["ssid1"], assets=["EURUSD_otc", "GBPUSD_otc"])
+            print("❌ Should have raised ValueError for too many assets")
+            return False
+        except ValueError:
+            pass  # Expected
+        
+        # Test round-robin asset assignment (no worker processes are started)
+        from ChipaPocketOptionData.multiprocessing_data import MultiProcessDataCollector
+        
+        collector = MultiProcessDataCollector(DataCollectorConfig(
+            ssids=["ssid1", "ssid2", "ssid3"],
+            proxies=proxies + [ProxyConfig(host="proxy3.com", port=8082)],
+            proxy_support=True,
+            assets=["EURUSD_otc", "GBPUSD_otc"],
+        ))
+        try:
+            workers = collector._assign_workers()
+            assert [w['asset'] for w in workers] == ["EURUSD_otc", "GBPUSD_otc", "EURUSD_otc"]
+            assert [w['proxy'] for w in workers] == list(collector.config.proxy_urls)
+            assert collector.processes == []
+        finally:
+            collector.stop()
+        
         print("✅ DataCollectorConfig works correctly")
         return True
     except Exception as e:
@@ -121,20 +202,168 @@ def test_collector_creation():
         return False
 
 
-async def test_with_real_ssid():
-    """Test with a real SSID (optional, interactive)."""
+def test_batch_serialization():
+    """Test that worker batches survive encoding, with and without msgspec."""
+    print("\nTesting batch serialization...")
+    try:
+        from ChipaPocketOptionData import multiprocessing_data as mpd
+        
+        batch = [{'open': 1.0, 'close': 1.5, 'time': 1}, {'error': 'boom', 'type': 'x'}]
+        message = mpd._encode_batch(3, batch)
+        if mpd.msgspec is not None:
+            assert isinstance(message, bytes)
+        assert mpd._decode_batch(message) == (3, batch)
+        
+        # Items msgspec cannot encode fall back to a tuple for the transport to pickle
+        odd = [{'value': object()}]
+        assert mpd._decode_batch(mpd._encode_batch(1, odd)) == (1, odd)
+        
+        # Without msgspec every batch is passed through as a tuple
+        saved, mpd.msgspec = mpd.msgspec, None
+        try:
+            message = mpd._encode_batch(2, batch)
+            assert message == (2, batch)
+            assert mpd._decode_batch(message) == (2, batch)
+        finally:
+            mpd.msgspec = saved
+        
+        print("✅ Batch serialization works correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Batch serialization failed: {e!r}")
+        return False
+
+
+def test_queue_group():
+    """Test reading several per-worker queues through one _QueueGroup."""
+    print("\nTesting per-worker queues...")
+    try:
+        import multiprocessing as mp
+        from ChipaPocketOptionData.multiprocessing_data import _QueueGroup
+        
+        group = _QueueGroup(mp.get_context(), 3)
+        for i, q in enumerate(group.queues):
+            q.put(("batch", i))
+        # Worker 0 is far ahead of the others
+        for _ in range(10):
+            group.queues[0].put(("batch", 0))
+        time.sleep(0.2)  # Let the feeder threads write
+        
+        # A small budget is still shared by every ready queue
+        messages = group.get_many(timeout=1, max_messages_to_get=6)
+        assert {worker for _, worker in messages} == {0, 1, 2}
+        
+        received = len(messages)
+        while received < 13:
+            received += len(group.get_many(timeout=1))
+        
+        try:
+            group.get_many(timeout=0.1)
+            print("❌ Should have raised queue.Empty once drained")
+            return False
+        except queue.Empty:
+            pass  # Expected
+        
+        print("✅ Per-worker queues work correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Per-worker queues failed: {e!r}")
+        return False
+
+
+def test_zmq_channel():
+    """Test sending raw and pickled messages over the ZeroMQ channel."""
+    print("\nTesting ZeroMQ channel...")
+    try:
+        from ChipaPocketOptionData import multiprocessing_data as mpd
+        
+        if mpd.zmq is None:
+            print("Skipping, pyzmq is not installed")
+            return True
+        
+        channel = mpd._ZmqChannel()
+        try:
+            assert not channel.full()
+            channel.put_nowait(b"raw bytes")
+            channel.put_nowait((1, [{'close': 2.0}], 0))
+            
+            messages = []
+            while len(messages) < 2:
+                messages.extend(channel.get_many(timeout=1))
+            assert bytes(messages[0]) == b"raw bytes"
+            assert messages[1] == (1, [{'close': 2.0}], 0)
+        finally:
+            channel.close()
+        
+        print("✅ ZeroMQ channel works correctly")
+        return True
+    except Exception as e:
+        print(f"❌ ZeroMQ channel failed: {e!r}")
+        return False
+
+
+def test_drop_accounting():
+    """Test that workers count batches dropped on a full queue."""
+    print("\nTesting drop accounting...")
+    try:
+        from ChipaPocketOptionData import multiprocessing_data as mpd
+        
+        class FakeQueue:
+            """Output queue that is full until told otherwise."""
+            def __init__(self):
+                self.is_full = True
+                self.messages = []
+            
+            def full(self):
+                return self.is_full
+            
+            def put_nowait(self, message):
+                self.messages.append(message)
+        
+        output = FakeQueue()
+        settings = mpd._WorkerSettings(False, 1, "INFO", None, 1.0)
+        dropped = multiprocessing.RawValue('q', 0)
+        worker = mpd._DataCollectorProcess(
+            0, "ssid1", None, output, None, settings, None, dropped
+        )
+        
+        for i in range(mpd._BATCH_SIZE + 3):
+            worker._emit({'close': float(i)})
+        worker._flush()
+        assert output.messages == []
+        # The parent reads the shared counter; no batch has to get through
+        assert dropped.value == mpd._BATCH_SIZE + 3
+        
+        output.is_full = False
+        worker._emit({'close': 0.0})
+        worker._flush()
+        _, batch = mpd._decode_batch(output.messages[0])
+        assert len(batch) == 1 and dropped.value == mpd._BATCH_SIZE + 3
+        
+        print("✅ Drop accounting works correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Drop accounting failed: {e!r}")
+        return False
+
+
+def run_real_ssid_test():
+    """Test with a real SSID (optional, interactive; run from main() only, not pytest)."""
     print("\n" + "="*60)
     print("OPTIONAL: Test with real SSID")
     print("="*60)
     
-    test_real = input("\nDo you want to test with a real SSID? (y/n): ").strip().lower()
+    try:
+        test_real = input("\nDo you want to test with a real SSID? (y/n): ").strip().lower()
+        ssid = input("Enter your demo account SSID: ").strip() if test_real == 'y' else ""
+    except (EOFError, OSError):
+        # No interactive stdin (closed, or captured by a test runner)
+        test_real = ""
     
     if test_real != 'y':
         print("Skipping real SSID test")
         return True
     
-    ssid = input("Enter your demo account SSID: ").strip()
-    
     if not ssid:
         print("No SSID provided, skipping")
         return True
@@ -186,14 +415,13 @@ def main():
     results.append(("ProxyConfig", test_proxy_config()))
     results.append(("DataCollectorConfig", test_data_collector_config()))
     results.append(("Collector Creation", test_collector_creation()))
+    results.append(("Batch Serialization", test_batch_serialization()))
+    results.append(("Per-worker Queues", test_queue_group()))
+    results.append(("ZeroMQ Channel", test_zmq_channel()))
+    results.append(("Drop Accounting", test_drop_accounting()))
     
     # Run optional SSID test
-    if sys.version_info >= (3, 7):
-        try:
-            result = asyncio.run(test_with_real_ssid())
-            results.append(("Real SSID Test", result))
-        except Exception as e:
-            print(f"Error running async test: {e}")
+    results.append(("Real SSID Test", run_real_ssid_test()))
     
     # Print summary
     print("\n" + "="*60)